@@ -1,20 +1,37 @@
+import io
 import os
 import re
-import json
+import asyncio
+import contextlib
+import logging
+from typing import Any, AsyncIterator, Iterator
 import httpx
-from openai import OpenAI, AuthenticationError, APIConnectionError, APIStatusError
+import ijson
+import orjson
+import tiktoken
+from cachetools import TTLCache
+from openai import AsyncOpenAI, AsyncStream, AuthenticationError, APIConnectionError, APIError, APIStatusError
+from openai.types.chat import ChatCompletionChunk
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
-app = FastAPI(title="GitHub Repository Summarizer")
+logger = logging.getLogger(__name__)
 
 NEBIUS_BASE_URL = "https://api.tokenfactory.nebius.com/v1/"
 NEBIUS_MODEL = "meta-llama/Meta-Llama-3.1-8B-Instruct"
+# Slower but more reliable; only used when NEBIUS_MODEL returns unparseable JSON
+NEBIUS_FALLBACK_MODEL = "meta-llama/Meta-Llama-3.1-70B-Instruct"
+# The three response fields fit in ~150-250 tokens; generation time scales with this cap
+NEBIUS_MAX_TOKENS = 300
+# Fallback gets more room: a reply cut off at NEBIUS_MAX_TOKENS would be cut off again
+NEBIUS_FALLBACK_MAX_TOKENS = 800
 
 RAW_BASE = "https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{path}"
 GITHUB_API_BASE = "https://api.github.com"
 
+_GITHUB_URL_RE = re.compile(r"https?://github\.com/([^/]+)/([^/?\s#]+)")
+
 PRIORITY_FILES = [
     "README.md",
     "README.rst",
@@ -45,17 +62,95 @@ SOURCE_ENTRY_POINTS = [
     "main.rb", "app.rb",
 ]
 
-MAX_CONTENT_CHARS = 12000
+MAX_CONTENT_TOKENS = 3500
 MAX_SOURCE_FILE_CHARS = 3000  # cap per sampled source file
+SOURCE_FETCH_GRACE_SECONDS = 1.5  # source samples still in flight after this are dropped
+
+CHARS_PER_TOKEN = 4  # rough estimate used when the tokenizer is unavailable
+# Upper bound for pre-slicing text before encoding, so a large file isn't
+# tokenized in full just to keep its first few thousand tokens
+MAX_CHARS_PER_TOKEN = 8
+ENCODING_LOAD_TIMEOUT_SECONDS = 10.0
+ENCODING_RETRY_SECONDS = 60.0
+
+# Finished summaries keyed on (owner, repo, pushed_at): a push changes the key,
+# so entries for an updated repository simply stop being hit.
+_SUMMARY_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=900)
+
+# (owner, repo, branch, path) of raw files that recently returned 404. Only
+# consulted when the contents listing is unavailable and every priority name
+# would otherwise be probed; a successful listing is always authoritative.
+_MISSING_FILES: TTLCache = TTLCache(maxsize=4096, ttl=300)
+
+# Shared client so connections to GitHub are pooled (and multiplexed over HTTP/2)
+# across requests instead of paying a fresh TCP/TLS handshake per fetch.
+# Opened and closed by `lifespan`, so each app startup gets a usable client.
+_HTTP: httpx.AsyncClient | None = None
+
+
+# Caps in-flight requests per host. The REST API is held well under GitHub's
+# secondary rate limits; the raw CDN isn't subject to them and gets more room,
+# so queueing there doesn't eat into SOURCE_FETCH_GRACE_SECONDS.
+# The semaphores bind to the running event loop, so `lifespan` creates them.
+HOST_CONCURRENCY = {
+    "api.github.com": 6,
+    "raw.githubusercontent.com": 24,
+}
+_HOST_SEMAPHORES: dict[str, asyncio.Semaphore] = {}
+
+
+async def _github_get(url: str, **kwargs) -> httpx.Response:
+    async with _HOST_SEMAPHORES[httpx.URL(url).host]:
+        return await _HTTP.get(url, **kwargs)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    global _HTTP, _NEBIUS_CLIENT
+    _HTTP = httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(10.0, connect=3.0),
+        follow_redirects=True,
+        # README/manifest text compresses well; httpx decodes br via the brotli extra
+        headers={"Accept-Encoding": "br, gzip"},
+    )
+    _HOST_SEMAPHORES.update(
+        (host, asyncio.Semaphore(limit)) for host, limit in HOST_CONCURRENCY.items()
+    )
+    encoding_task = None
+    if not await _load_encoding():
+        encoding_task = asyncio.create_task(_retry_load_encoding())
+    try:
+        yield
+    finally:
+        if encoding_task is not None:
+            encoding_task.cancel()
+        await _HTTP.aclose()
+        _HTTP = None
+        _HOST_SEMAPHORES.clear()
+        if _NEBIUS_CLIENT is not None:
+            await _NEBIUS_CLIENT.close()
+            _NEBIUS_CLIENT = None
+
+
+app = FastAPI(
+    title="GitHub Repository Summarizer",
+    lifespan=lifespan,
+)
 
 
 class SummarizeRequest(BaseModel):
     github_url: str
 
 
+class SummaryResponse(BaseModel):
+    summary: str
+    technologies: list[Any]
+    structure: str
+
+
 def parse_github_url(url: str) -> tuple[str, str]:
-    pattern = r"https?://github\.com/([^/]+)/([^/?\s#]+)"
-    match = re.match(pattern, url.strip())
+    match = _GITHUB_URL_RE.match(url.strip())
     if not match:
         raise ValueError("Invalid GitHub URL...")
     owner = match.group(1)
@@ -73,54 +168,67 @@ def _github_headers() -> dict:
     return headers
 
 
-def fetch_repo_metadata(owner: str, repo: str) -> dict:
+async def fetch_repo_metadata(owner: str, repo: str) -> dict:
     """
-    Returns {"default_branch": str, "entries": [{"name": str, "type": "file"|"dir"}, ...]}.
+    Returns {"default_branch": str, "pushed_at": str | None, "listed": bool,
+             "entries": [{"name": str, "type": "file"|"dir"}, ...]}.
+    "listed" is False when the root listing could not be fetched, as opposed
+    to the repository simply having no root entries.
     Uses the GitHub REST API instead of HTML scraping.
+    The repo and root-contents requests are issued concurrently.
     """
     headers = _github_headers()
 
-    # 1. Resolve the default branch
+    repo_resp, contents_resp = await asyncio.gather(
+        _github_get(f"{GITHUB_API_BASE}/repos/{owner}/{repo}", headers=headers),
+        _github_get(f"{GITHUB_API_BASE}/repos/{owner}/{repo}/contents/", headers=headers),
+        return_exceptions=True,
+    )
+
+    # 1. Resolve the default branch and last push time
     default_branch = "main"
+    pushed_at = None
     try:
-        resp = httpx.get(
-            f"{GITHUB_API_BASE}/repos/{owner}/{repo}",
-            headers=headers,
-            timeout=10,
-            follow_redirects=True,
-        )
-        if resp.status_code == 200:
-            default_branch = resp.json().get("default_branch", "main")
-    except httpx.RequestError:
+        if isinstance(repo_resp, httpx.Response) and repo_resp.status_code == 200:
+            repo_info = orjson.loads(repo_resp.content)
+            default_branch = repo_info.get("default_branch", "main")
+            pushed_at = repo_info.get("pushed_at")
+    except ValueError:
         pass
 
-    # 2. List root directory contents
+    # 2. List root directory contents (404 for an empty or missing repository)
     entries: list[dict] = []
+    listed = isinstance(contents_resp, httpx.Response) and contents_resp.status_code in (200, 404)
     try:
-        resp = httpx.get(
-            f"{GITHUB_API_BASE}/repos/{owner}/{repo}/contents/",
-            headers=headers,
-            timeout=10,
-            follow_redirects=True,
-        )
-        if resp.status_code == 200:
-            for item in resp.json():
+        if listed and contents_resp.status_code == 200:
+            for item in orjson.loads(contents_resp.content):
                 entries.append({"name": item["name"], "type": item["type"]})
-    except (httpx.RequestError, ValueError):
-        pass
+    except ValueError:
+        listed = False
 
-    return {"default_branch": default_branch, "entries": entries}
+    return {"default_branch": default_branch, "pushed_at": pushed_at, "listed": listed, "entries": entries}
 
 
-def fetch_raw_file(owner: str, repo: str, path: str, branch: str) -> str | None:
+async def fetch_raw_file(owner: str, repo: str, path: str, branch: str) -> str | None:
+    """
+    Returns the file's text, or None if it does not exist. Transport errors and
+    other statuses raise httpx.HTTPError, so callers can tell a missing file
+    from a fetch that failed.
+    """
     url = RAW_BASE.format(owner=owner, repo=repo, branch=branch, path=path)
-    try:
-        resp = httpx.get(url, timeout=10, follow_redirects=True)
-        if resp.status_code == 200:
-            return resp.text
-    except httpx.RequestError:
-        pass
-    return None
+    resp = await _github_get(url)
+    if resp.status_code == 404:
+        _MISSING_FILES[(owner, repo, branch, path)] = True
+        return None
+    resp.raise_for_status()
+    return resp.text
+
+
+def _discard_task(task: asyncio.Task) -> None:
+    """Cancels a fetch whose result is no longer needed, without logging its failure."""
+    task.cancel()
+    if task.done() and not task.cancelled():
+        task.exception()
 
 
 def pick_source_files(entries: list[dict]) -> list[str]:
@@ -148,20 +256,86 @@ def pick_source_files(entries: list[dict]) -> list[str]:
     return chosen
 
 
-def collect_repo_content(owner: str, repo: str) -> dict:
-    meta = fetch_repo_metadata(owner, repo)
+async def collect_repo_content(
+    owner: str, repo: str, meta: dict, readme_task: asyncio.Task | None = None
+) -> dict:
+    """
+    `readme_task` is an already-running README.md fetch started before the
+    metadata resolved; it is reused instead of requesting the file again.
+    "complete" in the result is False if the root listing or any fetch failed,
+    or a source sample was dropped, so the caller can avoid caching a summary
+    built from partial context.
+    """
     branch = meta["default_branch"]
     entries = meta["entries"]
 
+    # Source samples are optional context: start them alongside the priority
+    # files, but don't let a slow one hold up the LLM call.
+    source_tasks = {
+        path: asyncio.create_task(fetch_raw_file(owner, repo, path, branch))
+        for path in pick_source_files(entries)
+    }
+
+    # Only request priority files the root listing says exist, so absent
+    # manifests cost no 404 round-trips. An empty listing means the contents
+    # call failed, in which case every name not recently seen as a 404 is probed.
+    present = {e["name"] for e in entries if e["type"] == "file"}
+    if present:
+        wanted = [name for name in PRIORITY_FILES if name in present]
+    else:
+        wanted = [name for name in PRIORITY_FILES if (owner, repo, branch, name) not in _MISSING_FILES]
+    if readme_task is not None and "README.md" not in wanted:
+        _discard_task(readme_task)
+
+    priority_tasks = [
+        readme_task if filename == "README.md" and readme_task is not None
+        else asyncio.create_task(fetch_raw_file(owner, repo, filename, branch))
+        for filename in wanted
+    ]
+
+    async def settle(task: asyncio.Task) -> str | None | httpx.HTTPError:
+        # A failed fetch is skipped (and marks the context incomplete); any
+        # other exception is a bug and still fails the request straight away
+        try:
+            return await task
+        except httpx.HTTPError as e:
+            return e
+
+    try:
+        # gather returns results in request order, so `files` keeps the
+        # PRIORITY_FILES ordering.
+        priority_results = await asyncio.gather(*(settle(task) for task in priority_tasks))
+        if source_tasks:
+            await asyncio.wait(source_tasks.values(), timeout=SOURCE_FETCH_GRACE_SECONDS)
+    except BaseException:
+        # gather doesn't cancel its siblings when one fails; don't leave
+        # fetches running for a request that is already failing
+        for task in (*priority_tasks, *source_tasks.values()):
+            task.cancel()
+        raise
+
+    complete = meta["listed"]
+
     files: dict[str, str] = {}
-    for filename in PRIORITY_FILES:
-        content = fetch_raw_file(owner, repo, filename, branch)
-        if content:
+    for filename, content in zip(wanted, priority_results):
+        if isinstance(content, httpx.HTTPError):
+            complete = False
+        elif content:
             files[filename] = content
 
+    for task in source_tasks.values():
+        if not task.done():
+            task.cancel()
+            complete = False
+
     source_files: dict[str, str] = {}
-    for path in pick_source_files(entries):
-        content = fetch_raw_file(owner, repo, path, branch)
+    for path, task in source_tasks.items():
+        if task.cancelled():
+            continue
+        if isinstance(task.exception(), httpx.HTTPError):
+            complete = False
+            continue
+        content = task.result()
         if content:
             source_files[path] = content[:MAX_SOURCE_FILE_CHARS]
 
@@ -169,12 +343,59 @@ def collect_repo_content(owner: str, repo: str) -> dict:
         "files": files,
         "source_files": source_files,
         "directory": [e["name"] for e in entries[:40]],
+        "complete": complete,
     }
 
 
+# cl100k_base is a close proxy for the Llama 3 tokenizer (which extends it).
+# Until it is loaded, token counts fall back to a character-based estimate.
+_ENCODING: tiktoken.Encoding | None = None
+
+
+async def _load_encoding() -> bool:
+    """
+    tiktoken downloads the BPE table on first use with no timeout, so load it
+    in a worker thread, bounded, instead of on the event loop mid-request.
+    """
+    global _ENCODING
+    try:
+        _ENCODING = await asyncio.wait_for(
+            asyncio.to_thread(tiktoken.get_encoding, "cl100k_base"),
+            timeout=ENCODING_LOAD_TIMEOUT_SECONDS,
+        )
+        return True
+    except Exception as e:
+        logger.warning("tiktoken encoding unavailable, estimating %d chars per token: %r", CHARS_PER_TOKEN, e)
+        return False
+
+
+async def _retry_load_encoding() -> None:
+    while not await _load_encoding():
+        await asyncio.sleep(ENCODING_RETRY_SECONDS)
+
+
+def count_tokens(text: str) -> int:
+    enc = _ENCODING
+    if enc is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    return len(enc.encode(text, disallowed_special=()))
+
+
+def truncate_tokens(text: str, limit: int) -> tuple[str, int]:
+    """Returns (text cut to at most `limit` tokens, its token count)."""
+    enc = _ENCODING
+    if enc is None:
+        snippet = text[:limit * CHARS_PER_TOKEN]
+        return snippet, -(-len(snippet) // CHARS_PER_TOKEN)
+    ids = enc.encode(text[:limit * MAX_CHARS_PER_TOKEN], disallowed_special=())[:limit]
+    return enc.decode(ids), len(ids)
+
+
 def build_context(data: dict) -> str:
-    parts = []
-    budget = MAX_CONTENT_CHARS
+    # Sections are written straight into one buffer rather than concatenated
+    # per file and joined at the end.
+    buf = io.StringIO()
+    budget = MAX_CONTENT_TOKENS
 
     files: dict[str, str] = data.get("files", {})
     source_files: dict[str, str] = data.get("source_files", {})
@@ -182,52 +403,68 @@ def build_context(data: dict) -> str:
 
     if directory:
         dir_text = "Root directory entries:\n" + "\n".join(f"  {e}" for e in directory)
-        parts.append(dir_text)
-        budget -= len(dir_text)
-
-    # README first, then other manifest/config files
-    ordered = []
-    for name in PRIORITY_FILES:
-        if name in files:
-            ordered.append((name, files[name]))
+        buf.write(dir_text)
+        budget -= count_tokens(dir_text)
 
-    for name, content in ordered:
+    # README first, then other manifest/config files: collect_repo_content
+    # inserts into `files` in PRIORITY_FILES order.
+    for name, content in files.items():
         if budget <= 0:
             break
         header = f"\n--- {name} ---\n"
-        available = budget - len(header)
+        header_tokens = count_tokens(header)
+        available = budget - header_tokens
         if available <= 0:
             break
-        snippet = content[:available]
-        parts.append(header + snippet)
-        budget -= len(header) + len(snippet)
+        snippet, snippet_tokens = truncate_tokens(content, available)
+        if buf.tell():
+            buf.write("\n")
+        buf.write(header)
+        buf.write(snippet)
+        budget -= header_tokens + snippet_tokens
 
     # Sampled source files fill whatever budget remains
     for name, content in source_files.items():
         if budget <= 0:
             break
         header = f"\n--- {name} (source sample) ---\n"
-        available = budget - len(header)
+        header_tokens = count_tokens(header)
+        available = budget - header_tokens
         if available <= 0:
             break
-        snippet = content[:available]
-        parts.append(header + snippet)
-        budget -= len(header) + len(snippet)
+        snippet, snippet_tokens = truncate_tokens(content, available)
+        if buf.tell():
+            buf.write("\n")
+        buf.write(header)
+        buf.write(snippet)
+        budget -= header_tokens + snippet_tokens
 
-    return "\n".join(parts)
+    return buf.getvalue()
 
 
-def call_nebius(context: str, owner: str, repo: str) -> dict:
-    api_key = os.environ.get("NEBIUS_API_KEY", "").strip()
-    if not api_key:
-        raise EnvironmentError("NEBIUS_API_KEY environment variable is not set.")
+_NEBIUS_CLIENT: AsyncOpenAI | None = None
 
-    client = OpenAI(
-        base_url=NEBIUS_BASE_URL,
-        api_key=api_key
-    )
 
-    prompt = f"""You are a code analyst. Analyze the following GitHub repository context for {owner}/{repo} and return ONLY valid JSON with exactly these fields:
+def _nebius_client() -> AsyncOpenAI:
+    """
+    Lazily built once per process so the connection to Nebius is reused
+    across requests instead of re-handshaking for every call.
+    """
+    global _NEBIUS_CLIENT
+    if _NEBIUS_CLIENT is None:
+        api_key = os.environ.get("NEBIUS_API_KEY", "").strip()
+        if not api_key:
+            raise EnvironmentError("NEBIUS_API_KEY environment variable is not set.")
+        _NEBIUS_CLIENT = AsyncOpenAI(
+            base_url=NEBIUS_BASE_URL,
+            api_key=api_key,
+            http_client=httpx.AsyncClient(http2=True, timeout=30),
+        )
+    return _NEBIUS_CLIENT
+
+
+def _build_prompt(context: str, owner: str, repo: str) -> str:
+    return f"""You are a code analyst. Analyze the following GitHub repository context for {owner}/{repo} and return ONLY valid JSON with exactly these fields:
 - "summary": a 2-4 sentence description of what the project does
 - "technologies": a JSON array of main languages, frameworks, and libraries used
 - "structure": a 1-2 sentence description of the project layout
@@ -237,9 +474,13 @@ Repository context:
 
 Respond with ONLY a JSON object, no markdown, no extra text."""
 
+
+async def _create_completion(
+    client: AsyncOpenAI, prompt: str, model: str, max_tokens: int = NEBIUS_MAX_TOKENS, stream: bool = False
+):
     try:
-        response = client.chat.completions.create(
-            model=NEBIUS_MODEL,
+        return await client.chat.completions.create(
+            model=model,
             messages=[
                 {
                     "role": "user",
@@ -252,7 +493,9 @@ Respond with ONLY a JSON object, no markdown, no extra text."""
                 }
             ],
             temperature=0.2,
-            max_tokens=800,
+            max_tokens=max_tokens,
+            response_format={"type": "json_object"},
+            stream=stream,
         )
     except AuthenticationError:
         raise PermissionError("Invalid NEBIUS_API_KEY.")
@@ -261,33 +504,179 @@ Respond with ONLY a JSON object, no markdown, no extra text."""
     except APIStatusError as e:
         raise RuntimeError(f"Nebius API returned {e.status_code}: {e.message}")
 
-    text = response.choices[0].message.content.strip()
 
-    # Robust JSON extraction: find the first '{' and last '}'
+async def call_nebius(context: str, owner: str, repo: str) -> dict:
+    client = _nebius_client()
+    prompt = _build_prompt(context, owner, repo)
+
+    try:
+        return await _request_summary(client, prompt, NEBIUS_MODEL, NEBIUS_MAX_TOKENS)
+    except orjson.JSONDecodeError:
+        return await _request_summary(client, prompt, NEBIUS_FALLBACK_MODEL, NEBIUS_FALLBACK_MAX_TOKENS)
+
+
+async def _request_summary(client: AsyncOpenAI, prompt: str, model: str, max_tokens: int) -> dict:
+    response = await _create_completion(client, prompt, model, max_tokens)
+    choice = response.choices[0]
+    text = choice.message.content.strip()
+
+    # json_object mode should yield a bare object, but not every model honours
+    # it: find the first '{' and last '}' to drop any fences or surrounding prose
     start_idx = text.find('{')
     end_idx = text.rfind('}')
-    
+
     if start_idx != -1 and end_idx != -1:
         json_text = text[start_idx : end_idx + 1]
     else:
         json_text = text
 
     try:
-        return json.loads(json_text)
-    except json.JSONDecodeError:
-        print(f"DEBUG: Failed to parse LLM response as JSON. Raw text:\n{text}")
+        return orjson.loads(json_text)
+    except orjson.JSONDecodeError:
+        if choice.finish_reason == "length":
+            logger.warning("%s reply was cut off at max_tokens=%d before the JSON closed", model, max_tokens)
+        logger.warning("Failed to parse %s response as JSON. Raw text:\n%s", model, text)
         raise
 
 
-@app.post("/summarize")
-def summarize(request: SummarizeRequest):
+async def open_nebius_stream(context: str, owner: str, repo: str) -> AsyncStream[ChatCompletionChunk]:
+    """
+    Starts a streamed completion. Awaiting this surfaces key/auth/connection
+    errors before any bytes are sent to the client.
+    """
+    client = _nebius_client()
+    return await _create_completion(client, _build_prompt(context, owner, repo), NEBIUS_MODEL, stream=True)
+
+
+SUMMARY_FIELDS = ("summary", "technologies", "structure")
+
+
+def normalise_field(field: str, value: Any) -> Any:
+    """
+    Coerces one model-supplied field to the SummaryResponse shape, so an
+    off-format reply (null, a comma-separated technologies string, a nested
+    structure object) is still served instead of failing validation.
+    """
+    if field == "technologies":
+        if value is None:
+            return []
+        if isinstance(value, str):
+            return [tech.strip() for tech in value.split(",") if tech.strip()]
+        return value if isinstance(value, list) else [value]
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return orjson.dumps(value).decode()
+    return str(value)
+
+
+async def stream_summary_fields(stream: AsyncStream[ChatCompletionChunk]) -> AsyncIterator[dict]:
+    """
+    Incrementally parses the streamed JSON object and yields each top-level
+    field as a one-key dict ({"summary": ...}, {"technologies": [...]},
+    {"structure": ...}) as soon as its value is complete.
+    Like _request_summary, anything before the first '{' (a fence, prose) and
+    after the object closes is ignored, and values of any JSON type are kept.
+    Raises ijson.JSONError if the object itself is not valid JSON.
+    """
+    events = ijson.sendable_list()
+    parser = ijson.parse_coro(events, use_float=True)
+    started = closed = False
+    field, builder, depth = None, None, 0
+
+    def completed_fields() -> Iterator[dict]:
+        nonlocal closed, field, builder, depth
+        for prefix, event, value in events:
+            if closed:
+                break
+            if prefix == "":
+                # Top level: a new key starts a new value; end_map ends the object
+                if event == "map_key":
+                    field, builder, depth = value, ijson.ObjectBuilder(), 0
+                elif event == "end_map":
+                    closed = True
+                continue
+            if builder is None:
+                continue
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+            if depth == 0:
+                if field in SUMMARY_FIELDS:
+                    yield {field: builder.value}
+                builder = None
+        del events[:]
+
+    async for chunk in stream:
+        if not (chunk.choices and chunk.choices[0].delta.content):
+            continue
+        delta = chunk.choices[0].delta.content
+        if not started:
+            brace = delta.find("{")
+            if brace == -1:
+                continue
+            delta, started = delta[brace:], True
+        try:
+            parser.send(delta.encode())
+        except ijson.JSONError:
+            # Trailing text (e.g. a closing fence) in the same chunk as the
+            # final '}' is fine; an error inside the object is not.
+            for item in completed_fields():
+                yield item
+            if not closed:
+                raise
+        for item in completed_fields():
+            yield item
+        if closed:
+            return
+
+    # Stream ended before the object closed: surfaces as premature EOF
+    parser.close()
+    for item in completed_fields():
+        yield item
+
+
+async def _prepare_summary(github_url: str) -> dict | JSONResponse:
+    """
+    Runs everything up to the LLM call. Returns a JSONResponse on request or
+    fetch errors; otherwise {"owner", "repo", "cache_key", "cached", "context",
+    "complete"}, where "cached" holds the finished summary on a cache hit (and
+    "context" is None) and "complete" says whether the context is safe to cache.
+    """
     try:
-        owner, repo = parse_github_url(request.github_url)
+        owner, repo = parse_github_url(github_url)
     except ValueError as e:
         return JSONResponse(status_code=400, content={"status": "error", "message": str(e)})
 
+    # The README is needed on every cache miss, so fetch it while the metadata
+    # resolves; the HEAD ref points raw.githubusercontent.com at the default branch.
+    # Trade-off: a cache hit is only known once the metadata returns, so hits
+    # also pay for this one (cancelled) raw request.
+    readme_task = asyncio.create_task(fetch_raw_file(owner, repo, "README.md", "HEAD"))
+
+    try:
+        meta = await fetch_repo_metadata(owner, repo)
+    except Exception as e:
+        _discard_task(readme_task)
+        return JSONResponse(status_code=502, content={"status": "error", "message": f"Failed to fetch repository: {e}"})
+
+    # Without pushed_at we cannot tell whether a cached summary is stale
+    cache_key = (owner, repo, meta["pushed_at"]) if meta["pushed_at"] else None
+    prepared = {
+        "owner": owner, "repo": repo, "cache_key": cache_key,
+        "cached": None, "context": None, "complete": False,
+    }
+    if cache_key in _SUMMARY_CACHE:
+        _discard_task(readme_task)
+        prepared["cached"] = _SUMMARY_CACHE[cache_key]
+        return prepared
+
     try:
-        data = collect_repo_content(owner, repo)
+        data = await collect_repo_content(owner, repo, meta, readme_task)
     except Exception as e:
         return JSONResponse(status_code=502, content={"status": "error", "message": f"Failed to fetch repository: {e}"})
 
@@ -297,21 +686,97 @@ def summarize(request: SummarizeRequest):
             "message": "Repository not found or is empty.",
         })
 
-    context = build_context(data)
+    prepared["context"] = build_context(data)
+    prepared["complete"] = data["complete"]
+    return prepared
 
-    try:
-        result = call_nebius(context, owner, repo)
-    except EnvironmentError as e:
-        return JSONResponse(status_code=500, content={"status": "error", "message": str(e)})
-    except PermissionError as e:
+
+def _nebius_error_response(e: Exception) -> JSONResponse:
+    # PermissionError and ConnectionError are both OSError (EnvironmentError)
+    # subclasses, so they must be matched before the missing-key case.
+    if isinstance(e, PermissionError):
         return JSONResponse(status_code=401, content={"status": "error", "message": str(e)})
-    except (ConnectionError, RuntimeError) as e:
+    if isinstance(e, ConnectionError):
         return JSONResponse(status_code=502, content={"status": "error", "message": str(e)})
-    except json.JSONDecodeError:
+    if isinstance(e, EnvironmentError):
+        return JSONResponse(status_code=500, content={"status": "error", "message": str(e)})
+    return JSONResponse(status_code=502, content={"status": "error", "message": str(e)})
+
+
+@app.post("/summarize", response_model=SummaryResponse)
+async def summarize(request: SummarizeRequest):
+    prepared = await _prepare_summary(request.github_url)
+    if isinstance(prepared, JSONResponse):
+        return prepared
+    if prepared["cached"] is not None:
+        return prepared["cached"]
+
+    try:
+        result = await call_nebius(prepared["context"], prepared["owner"], prepared["repo"])
+    except (EnvironmentError, PermissionError, ConnectionError, RuntimeError) as e:
+        return _nebius_error_response(e)
+    except orjson.JSONDecodeError:
         return JSONResponse(status_code=502, content={"status": "error", "message": "LLM returned invalid JSON."})
 
-    return {
-        "summary": result.get("summary", ""),
-        "technologies": result.get("technologies", []),
-        "structure": result.get("structure", ""),
-    }
+    summary = {field: normalise_field(field, result.get(field)) for field in SUMMARY_FIELDS}
+    # A summary of partial context would otherwise stick for the whole TTL
+    if prepared["cache_key"] is not None and prepared["complete"]:
+        _SUMMARY_CACHE[prepared["cache_key"]] = summary
+    return summary
+
+
+@app.post("/summarize/stream")
+async def summarize_stream(request: SummarizeRequest):
+    """
+    Same result as /summarize, streamed as newline-delimited JSON: one
+    {"<field>": value} line per field as soon as the model has produced it.
+    A mid-stream failure is reported as a final {"status": "error", ...} line.
+    """
+    prepared = await _prepare_summary(request.github_url)
+    if isinstance(prepared, JSONResponse):
+        return prepared
+
+    if prepared["cached"] is not None:
+        cached = prepared["cached"]
+
+        async def replay() -> AsyncIterator[bytes]:
+            for field, value in cached.items():
+                yield orjson.dumps({field: value}) + b"\n"
+
+        return StreamingResponse(replay(), media_type="application/x-ndjson")
+
+    try:
+        stream = await open_nebius_stream(prepared["context"], prepared["owner"], prepared["repo"])
+    except (EnvironmentError, PermissionError, ConnectionError, RuntimeError) as e:
+        return _nebius_error_response(e)
+
+    async def body() -> AsyncIterator[bytes]:
+        summary = {"summary": "", "technologies": [], "structure": ""}
+        emitted: set[str] = set()
+        try:
+            async for field in stream_summary_fields(stream):
+                field = {name: normalise_field(name, value) for name, value in field.items()}
+                summary.update(field)
+                emitted.update(field)
+                yield orjson.dumps(field) + b"\n"
+        except ijson.JSONError:
+            yield orjson.dumps({"status": "error", "message": "LLM returned invalid JSON."}) + b"\n"
+            return
+        except (APIError, httpx.HTTPError) as e:
+            # APIError also covers error events sent inside the SSE stream;
+            # raw httpx errors (read timeouts, dropped connections) can
+            # surface from the body without being wrapped by the SDK
+            yield orjson.dumps({"status": "error", "message": f"Nebius stream failed: {e}"}) + b"\n"
+            return
+        finally:
+            # Also runs on client disconnect, when the generator is closed
+            await stream.close()
+
+        # Mirror /summarize's defaults for any field the model left out
+        for field, value in summary.items():
+            if field not in emitted:
+                yield orjson.dumps({field: value}) + b"\n"
+        if prepared["cache_key"] is not None and prepared["complete"]:
+            _SUMMARY_CACHE[prepared["cache_key"]] = summary
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
@@ -0,0 +1,123 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import httpx
+import ijson
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from main import stream_summary_fields
+
+
+class FakeStream:
+    """Async-iterable stand-in for the SDK's AsyncStream of chat chunks."""
+
+    def __init__(self, text: str, size: int = 5):
+        self.deltas = [text[i:i + size] for i in range(0, len(text), size)]
+
+    async def __aiter__(self):
+        for delta in self.deltas:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))])
+
+    async def close(self):
+        self.closed = True
+
+
+def collect(text: str, size: int = 5) -> list[dict]:
+    async def run():
+        return [field async for field in stream_summary_fields(FakeStream(text, size))]
+    return asyncio.run(run())
+
+
+def test_yields_each_field_in_order():
+    text = '{"summary": "A tool.", "technologies": ["Python", "FastAPI"], "structure": "Flat."}'
+    assert collect(text) == [
+        {"summary": "A tool."},
+        {"technologies": ["Python", "FastAPI"]},
+        {"structure": "Flat."},
+    ]
+
+
+def test_ignores_fences_and_prose_around_the_object():
+    body = '{"summary": "s", "technologies": [], "structure": "x"}'
+    expected = [{"summary": "s"}, {"technologies": []}, {"structure": "x"}]
+    assert collect("```json\n" + body + "\n```") == expected
+    assert collect("Here is the JSON:\n" + body) == expected
+    # Closing fence arriving in the same chunk as the final '}'
+    assert collect(body + "\n```", size=len(body) + 4) == expected
+
+
+def test_keeps_non_string_technologies():
+    text = '{"summary": "s", "technologies": ["Python", 3, {"name": "Rust"}], "structure": "x"}'
+    assert {"technologies": ["Python", 3, {"name": "Rust"}]} in collect(text)
+
+
+def test_skips_unknown_fields():
+    assert collect('{"summary": "s", "extra": {"a": [1]}, "structure": "x"}') == [
+        {"summary": "s"},
+        {"structure": "x"},
+    ]
+
+
+def test_truncated_object_raises_after_completed_fields():
+    fields = []
+
+    async def run():
+        async for field in stream_summary_fields(FakeStream('{"summary": "s", "technologies": ["Py')):
+            fields.append(field)
+
+    with pytest.raises(ijson.JSONError):
+        asyncio.run(run())
+    assert fields == [{"summary": "s"}]
+
+
+def test_summarize_normalises_off_format_fields(monkeypatch):
+    async def prepared(github_url):
+        return {
+            "owner": "o", "repo": "r", "cache_key": ("o", "r", "t"),
+            "cached": None, "context": "ctx", "complete": True,
+        }
+
+    async def reply(context, owner, repo):
+        return {"summary": None, "technologies": "Python, FastAPI", "structure": {"src": "code"}}
+
+    monkeypatch.setattr(main, "_prepare_summary", prepared)
+    monkeypatch.setattr(main, "call_nebius", reply)
+    monkeypatch.setattr(main, "_SUMMARY_CACHE", {})
+
+    expected = {"summary": "", "technologies": ["Python", "FastAPI"], "structure": '{"src":"code"}'}
+    client = TestClient(main.app)
+    assert client.post("/summarize", json={"github_url": "o/r"}).json() == expected
+    assert main._SUMMARY_CACHE[("o", "r", "t")] == expected
+
+
+def test_stream_reports_mid_stream_failure(monkeypatch):
+    class FailingStream(FakeStream):
+        async def __aiter__(self):
+            async for chunk in super().__aiter__():
+                yield chunk
+            raise httpx.ReadTimeout("timed out")
+
+    stream = FailingStream('{"summary": "s", "technologies": ["Py')
+
+    async def prepared(github_url):
+        return {
+            "owner": "o", "repo": "r", "cache_key": ("o", "r", "t"),
+            "cached": None, "context": "ctx", "complete": True,
+        }
+
+    async def opened(context, owner, repo):
+        return stream
+
+    monkeypatch.setattr(main, "_prepare_summary", prepared)
+    monkeypatch.setattr(main, "open_nebius_stream", opened)
+    monkeypatch.setattr(main, "_SUMMARY_CACHE", {})
+
+    resp = TestClient(main.app).post("/summarize/stream", json={"github_url": "o/r"})
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert lines[0] == {"summary": "s"}
+    assert lines[-1]["status"] == "error"
+    assert stream.closed
+    assert not main._SUMMARY_CACHE